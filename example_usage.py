@@ -6,7 +6,10 @@ This script demonstrates how to use the tool programmatically.
 """
 
 import json
+import logging
+from collections import Counter
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
 
 from pdf_acroform_extractor import PDFAcroformExtractor
@@ -34,22 +37,21 @@ def example_basic_extraction():
         "form3.pdf"
     ]
 
-    # Note: This will fail if PDFs don't exist - replace with your actual PDFs
-    try:
-        fields = extractor.extract_from_multiple_files(pdf_files)
-
-        print(f"\nExtracted {len(fields)} fields")
-        print("\nFirst field:")
-        print(json.dumps(fields[0], indent=2))
+    # Note: Missing PDFs are skipped - replace with your actual PDFs
+    fields = extractor.extract_from_multiple_files(pdf_files)
+    if not fields:
+        print("\n⚠️  No fields extracted - were the PDFs found?")
+        print("This is just an example. Replace with your actual PDF paths.")
+        return
 
-        # Save raw extraction
-        with open("raw_extraction.json", "w") as f:
-            json.dump(fields, f, indent=2)
-        print("\nRaw extraction saved to: raw_extraction.json")
+    print(f"\nExtracted {len(fields)} fields")
+    print("\nFirst field:")
+    print(json.dumps(fields[0], indent=2))
 
-    except FileNotFoundError as e:
-        print(f"\n⚠️  PDFs not found: {e}")
-        print("This is just an example. Replace with your actual PDF paths.")
+    # Save raw extraction
+    with open("raw_extraction.json", "wb") as f:
+        f.write(orjson.dumps(fields, option=orjson.OPT_INDENT_2))
+    print("\nRaw extraction saved to: raw_extraction.json")
 
 
 def example_full_processing():
@@ -74,6 +76,10 @@ def example_full_processing():
         print("\nStep 1: Extracting fields from PDFs...")
         extractor = PDFAcroformExtractor()
         fields = extractor.extract_from_multiple_files(pdf_files)
+        if not fields:
+            print("\n⚠️  No fields extracted - were the PDFs found?")
+            print("This is just an example. Replace with your actual PDF paths.")
+            return
         print(f"Extracted {len(fields)} fields")
 
         # Step 2: Process with LLM
@@ -83,29 +89,25 @@ def example_full_processing():
 
         # Step 3: Save results
         print("\nStep 3: Saving results...")
-        with open("combined_forms.json", "w") as f:
-            json.dump(combined_forms, f, indent=2)
+        with open("combined_forms.json", "wb") as f:
+            f.write(orjson.dumps(combined_forms, option=orjson.OPT_INDENT_2))
 
         print(f"\n✓ Successfully processed {len(combined_forms)} fields")
         print("Output saved to: combined_forms.json")
 
-        # Print summary
-        parent_count = sum(
-            1 for v in combined_forms.values()
-            if v.get("_metadata", {}).get("is_parent_question")
-        )
-        print(f"\nGenerated {parent_count} parent questions")
-
+        # Print summary (one pass over the output)
+        parent_count = 0
         groups = set()
         for v in combined_forms.values():
-            group = v.get("_metadata", {}).get("group")
+            metadata = v.get("_metadata") or {}
+            if metadata.get("is_parent_question"):
+                parent_count += 1
+            group = metadata.get("group")
             if group:
                 groups.add(group)
+        print(f"\nGenerated {parent_count} parent questions")
         print(f"Created {len(groups)} field groups: {', '.join(sorted(groups))}")
 
-    except FileNotFoundError as e:
-        print(f"\n⚠️  PDFs not found: {e}")
-        print("This is just an example. Replace with your actual PDF paths.")
     except Exception as e:
         print(f"\n❌ Error: {e}")
 
@@ -162,32 +164,37 @@ def example_analyze_output():
     # Analyze structure
     print(f"\nTotal fields: {len(forms)}")
 
-    # Group by type
-    type_counts = {}
-    for field in forms.values():
-        field_type = field.get("type", "unknown")
-        type_counts[field_type] = type_counts.get(field_type, 0) + 1
+    # Collect all statistics in a single pass over the fields
+    type_counts = Counter()
+    order_index_counts = Counter()  # fields with same order_index render together
+    conditional_fields = []
+    parent_questions = []
+    for name, field in forms.items():
+        metadata = field.get("_metadata") or {}
 
+        type_counts[field.get("type", "unknown")] += 1
+
+        order_idx = metadata.get("order_index")
+        if order_idx is not None:
+            order_index_counts[order_idx] += 1
+
+        if metadata.get("parent"):
+            conditional_fields.append(name)
+
+        if metadata.get("is_parent_question"):
+            parent_questions.append(name)
+
+    # Group by type
     print("\nFields by type:")
     for field_type, count in sorted(type_counts.items()):
         print(f"  {field_type}: {count}")
 
-    # Group by order_index (fields with same order_index render together)
-    order_index_counts = {}
-    for field in forms.values():
-        order_idx = field.get("_metadata", {}).get("order_index")
-        if order_idx is not None:
-            order_index_counts[order_idx] = order_index_counts.get(order_idx, 0) + 1
-
+    # Group by order_index
     print("\nFields by rendering group (order_index):")
     for order_idx, count in sorted(order_index_counts.items()):
         print(f"  Group {order_idx}: {count} fields")
 
-    # Find conditional fields
-    conditional_fields = [
-        name for name, field in forms.items()
-        if field.get("_metadata", {}).get("parent")
-    ]
+    # Conditional fields
     print(f"\nConditional fields: {len(conditional_fields)}")
     if conditional_fields:
         print("Examples:")
@@ -195,11 +202,7 @@ def example_analyze_output():
             parent = forms[name]["_metadata"]["parent"]
             print(f"  • {name} (depends on {parent})")
 
-    # Find parent questions
-    parent_questions = [
-        name for name, field in forms.items()
-        if field.get("_metadata", {}).get("is_parent_question")
-    ]
+    # Parent questions
     print(f"\nParent questions: {len(parent_questions)}")
     if parent_questions:
         print("Examples:")
@@ -209,6 +212,9 @@ def example_analyze_output():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    logging.getLogger("pdf_acroform_extractor").setLevel(logging.INFO)
+
     print("\nPDF Acroform Extractor - Example Usage")
     print("=" * 60)
     print("\nThis script demonstrates various ways to use the tool.")
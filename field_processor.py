@@ -4,22 +4,606 @@ Handles intelligent deduplication, grouping, and conditional logic generation
 using Claude AI.
 """
 
-import json
+import hashlib
 import re
-from typing import List, Dict, Any, Optional, Tuple
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Callable, Deque, Iterable
 from anthropic import Anthropic
+import orjson
 import os
+from pathlib import Path
+
+
+# Tools used to force structured (schema-checked JSON) LLM responses
+DEDUP_TOOL = {
+    "name": "emit_duplicate_groups",
+    "description": "Report groups of fields that represent the same information.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "groups": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "canonical_name": {"type": "string"},
+                        "field_indices": {"type": "array", "items": {"type": "integer"}},
+                        "reasoning": {"type": "string"}
+                    },
+                    "required": ["canonical_name", "field_indices"]
+                }
+            }
+        },
+        "required": ["groups"]
+    }
+}
+
+GROUP_TOOL = {
+    "name": "emit_field_groups",
+    "description": "Report groups of related fields to render together.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "groups": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "group_name": {"type": "string"},
+                        "field_indices": {"type": "array", "items": {"type": "integer"}},
+                        "description": {"type": "string"}
+                    },
+                    "required": ["group_name", "field_indices"]
+                }
+            }
+        },
+        "required": ["groups"]
+    }
+}
+
+GROUP_MERGE_TOOL = {
+    "name": "emit_group_name_mapping",
+    "description": "Map each group name to the canonical name of its cluster of synonyms.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "mapping": {
+                "type": "object",
+                "description": "Maps every input group name, exactly as given, to its canonical name",
+                "additionalProperties": {"type": "string"}
+            }
+        },
+        "required": ["mapping"]
+    }
+}
+
+CONDITIONAL_LOGIC_TOOL = {
+    "name": "emit_conditional_logic",
+    "description": "Report parent questions and the conditions under which fields are shown.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "parent_questions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "question_id": {"type": "string"},
+                        "label": {"type": "string"},
+                        "type": {"type": "string", "enum": ["boolean", "number", "choice"]},
+                        "options": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["question_id", "label", "type"]
+                }
+            },
+            "field_relationships": {
+                "type": "object",
+                "description": "Maps field indices (as strings) to their parent condition",
+                "additionalProperties": {
+                    "type": "object",
+                    "properties": {
+                        "parent_id": {"type": "string"},
+                        "condition": {
+                            "type": "object",
+                            "properties": {
+                                "operator": {
+                                    "type": "string",
+                                    "enum": [
+                                        "equals", "not_equals", "greater_than",
+                                        "greater_or_equal", "less_than", "less_or_equal"
+                                    ]
+                                },
+                                "value": {}
+                            },
+                            "required": ["operator", "value"]
+                        }
+                    },
+                    "required": ["parent_id"]
+                }
+            }
+        },
+        "required": ["parent_questions", "field_relationships"]
+    }
+}
+
+LABEL_TOOL = {
+    "name": "emit_labels",
+    "description": "Report a user-friendly label and explanation for each field name.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "labels": {
+                "type": "object",
+                "description": "Maps each input field name, exactly as given, to its label",
+                "additionalProperties": {
+                    "type": "object",
+                    "properties": {
+                        "label": {"type": "string"},
+                        "explanation": {"type": "string"}
+                    },
+                    "required": ["label", "explanation"]
+                }
+            }
+        },
+        "required": ["labels"]
+    }
+}
+
+
+# Static task instructions, sent as a cacheable prompt block ahead of the
+# variable field data
+DEDUP_INSTRUCTIONS = """You are an expert at analyzing form fields. I have extracted fields from multiple PDF forms and need to identify which fields are duplicates or represent the same information.
+
+Your task:
+1. Identify groups of fields that represent the SAME information (e.g., "Full Name", "Name", "Applicant Name" all mean the same thing)
+2. Be intelligent - not too strict (don't require exact string match) but not too loose (don't merge "First Name" with "Full Name")
+3. For each group, select the BEST field name to represent the group (clearest, most complete)
+
+Report the groups with the emit_duplicate_groups tool. Each group should have:
+- "canonical_name": The best field name to use
+- "field_indices": Array of indices from the input that belong to this group
+- "reasoning": Brief explanation of why these are the same
+
+Example:
+{
+  "groups": [
+    {
+      "canonical_name": "Full Name",
+      "field_indices": [0, 5, 12],
+      "reasoning": "All refer to the applicant's complete name"
+    },
+    {
+      "canonical_name": "Date of Birth",
+      "field_indices": [1],
+      "reasoning": "Unique field, no duplicates"
+    }
+  ]
+}"""
+
+GROUP_INSTRUCTIONS = """You are an expert at organizing form fields. I need to group related fields together for better UI rendering.
+
+Your task:
+1. Identify fields that should be grouped together (e.g., First Name, Middle Name, Last Name form a "name" group)
+2. Common groups include: name, address, contact, employment, spouse, children, etc.
+3. Each field should belong to exactly one group
+4. Create meaningful group names
+
+Report the groups with the emit_field_groups tool. Each group should have:
+- "group_name": Name of the group (e.g., "name", "address")
+- "field_indices": Array of field indices that belong to this group
+- "description": Brief description of what this group represents
+
+Example:
+{
+  "groups": [
+    {
+      "group_name": "name",
+      "field_indices": [0, 1, 2],
+      "description": "Applicant's full name components"
+    },
+    {
+      "group_name": "address",
+      "field_indices": [3, 4, 5, 6, 7],
+      "description": "Residential address fields"
+    }
+  ]
+}"""
+
+GROUP_MERGE_INSTRUCTIONS = """You are an expert at organizing form fields. Form fields were grouped in several separate passes, so the same kind of group may appear under different names (e.g., "name" and "applicant_name", or "contact" and "contact_info").
+
+Your task:
+1. Cluster group names that are synonyms, i.e. describe the same group of fields
+2. Choose one canonical name for each cluster (one of the names in the cluster)
+3. Do not merge groups that describe different things (e.g., keep "spouse_name" separate from "name")
+
+Report the result with the emit_group_name_mapping tool, mapping every input group name, exactly as given, to its canonical name. Names without synonyms map to themselves.
+
+Example:
+{
+  "mapping": {
+    "name": "name",
+    "applicant_name": "name",
+    "address": "address",
+    "spouse_name": "spouse_name"
+  }
+}"""
+
+CONDITIONAL_LOGIC_INSTRUCTIONS = """You are an expert at designing smart forms. I need to create a decision tree for form fields to avoid showing irrelevant questions.
+
+Your task:
+1. Identify patterns where multiple fields could be controlled by a single parent question
+2. For example: if there are spouse1, spouse2... spouse6 fields, create a parent question "Are you married?" or "How many spouses?"
+3. For example: if there are child1, child2... fields, create "Do you have children?" and "How many children?"
+4. Create logical parent-child relationships WITH condition values
+
+Report the result with the emit_conditional_logic tool. It takes:
+- "parent_questions": Array of new high-level questions to add
+  Each has: {
+    "question_id": unique ID,
+    "label": The question to ask,
+    "type": "boolean", "number", or "choice",
+    "options": (if type is choice)
+  }
+- "field_relationships": Object mapping field indices to their condition
+  Each has: {
+    "parent_id": parent question ID,
+    "condition": {
+      "operator": "equals", "greater_than", "greater_or_equal", "less_than", "less_or_equal", "not_equals",
+      "value": the value to compare against
+    }
+  }
+
+Example:
+{
+  "parent_questions": [
+    {
+      "question_id": "are_you_married",
+      "label": "Are you married?",
+      "type": "boolean"
+    },
+    {
+      "question_id": "num_children",
+      "label": "How many children do you have?",
+      "type": "number"
+    }
+  ],
+  "field_relationships": {
+    "5": {
+      "parent_id": "are_you_married",
+      "condition": {"operator": "equals", "value": true}
+    },
+    "6": {
+      "parent_id": "are_you_married",
+      "condition": {"operator": "equals", "value": true}
+    },
+    "10": {
+      "parent_id": "num_children",
+      "condition": {"operator": "greater_than", "value": 0}
+    },
+    "11": {
+      "parent_id": "num_children",
+      "condition": {"operator": "greater_or_equal", "value": 2}
+    }
+  }
+}"""
+
+LABEL_INSTRUCTIONS = """Given a list of form field names, create for each one:
+1. A clear, user-friendly question/label
+2. A helpful explanation that guides the user on how to fill it
+
+Make it clear and professional. For example:
+- Field "DOB" -> label: "What is your date of birth?", explanation: "Enter your date of birth as it appears on your birth certificate (MM/DD/YYYY)"
+- Field "Applicant Full Name" -> label: "What is your full name?", explanation: "Enter your complete legal name as it appears on official documents"
+
+Report the results with the emit_labels tool, mapping every input field name, exactly as given, to its label and explanation:
+{
+  "labels": {
+    "DOB": {
+      "label": "What is your date of birth?",
+      "explanation": "Enter your date of birth as it appears on your birth certificate (MM/DD/YYYY)"
+    }
+  }
+}"""
+
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _prompt_json(obj: Any) -> str:
+    """Serialize data for inclusion in a prompt as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+def _normalize_field_name(field_name: str) -> str:
+    """Normalize a field name, ignoring case, whitespace and punctuation."""
+    return _NON_WORD_RE.sub(" ", field_name).strip().lower() or field_name
+
+
+# Labels for common, unambiguous field names, keyed by normalized name. These
+# are answered locally without an LLM request.
+_COMMON_LABEL_TEMPLATES = [
+    (("first name", "given name"),
+     "What is your first name?",
+     "Enter your legal first name as it appears on official documents"),
+    (("middle name",),
+     "What is your middle name?",
+     "Enter your middle name, if you have one"),
+    (("last name", "surname", "family name"),
+     "What is your last name?",
+     "Enter your legal last name as it appears on official documents"),
+    (("full name",),
+     "What is your full name?",
+     "Enter your complete legal name as it appears on official documents"),
+    (("email", "e mail", "email address"),
+     "What is your email address?",
+     "Enter an email address where you can be contacted (e.g. name@example.com)"),
+    (("phone", "phone number", "telephone", "telephone number"),
+     "What is your phone number?",
+     "Enter a phone number where you can be reached, including area code"),
+    (("mobile", "mobile phone", "cell phone", "mobile number", "cell phone number"),
+     "What is your mobile phone number?",
+     "Enter your mobile phone number, including area code"),
+    (("fax", "fax number"),
+     "What is your fax number?",
+     "Enter your fax number, including area code, if you have one"),
+    (("dob", "date of birth", "birth date"),
+     "What is your date of birth?",
+     "Enter your date of birth as it appears on your birth certificate (MM/DD/YYYY)"),
+    (("ssn", "social security number"),
+     "What is your Social Security number?",
+     "Enter your 9-digit Social Security number (XXX-XX-XXXX)"),
+    (("street", "street address", "address"),
+     "What is your street address?",
+     "Enter your street number and name"),
+    (("apt", "apartment", "apt number", "suite"),
+     "What is your apartment or suite number?",
+     "Enter your apartment, suite, or unit number, if any"),
+    (("city", "town"),
+     "What city do you live in?",
+     "Enter the city or town of your address"),
+    (("state",),
+     "What state do you live in?",
+     "Enter the state of your address"),
+    (("zip", "zip code", "postal code"),
+     "What is your ZIP code?",
+     "Enter the ZIP or postal code of your address"),
+    (("country",),
+     "What country do you live in?",
+     "Enter the country of your address"),
+]
+
+COMMON_LABELS: Dict[str, Dict[str, str]] = {
+    alias: {"label": label, "explanation": explanation}
+    for aliases, label, explanation in _COMMON_LABEL_TEMPLATES
+    for alias in aliases
+}
+
+
+class RateLimiter:
+    """Thread-safe limiter allowing at most max_rate calls per time_period seconds."""
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_rate: Maximum number of calls allowed per time period (at least 1)
+            time_period: Length of the sliding window in seconds
+        """
+        if max_rate < 1:
+            raise ValueError(f"max_rate must be at least 1, got {max_rate}")
+        if time_period <= 0:
+            raise ValueError(f"time_period must be positive, got {time_period}")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._lock = threading.Lock()
+        self._timestamps: Deque[float] = deque()
+
+    def acquire(self) -> None:
+        """Block until another call is allowed, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.time_period:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.max_rate:
+                    self._timestamps.append(now)
+                    return
+                wait = self.time_period - (now - self._timestamps[0])
+            time.sleep(wait)
+
+
+class LabelCache:
+    """Persistent on-disk cache of generated field labels and explanations."""
+
+    def __init__(self, path: str = ".label_cache.sqlite"):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS labels (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, field_name: str) -> str:
+        """Build the cache key for a field name under a given model."""
+        return hashlib.sha256(f"{model}\0{field_name}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the cached label/explanation for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM labels WHERE key = ?", (key,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict[str, str]) -> None:
+        """Store a label/explanation under key."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO labels (key, value) VALUES (?, ?)",
+                (key, orjson.dumps(value).decode())
+            )
+            self._conn.commit()
+
+
+class SemanticLabelCache:
+    """
+    Label cache that matches paraphrased field names using sentence embeddings.
+
+    Field names whose embedding has cosine similarity of at least `threshold`
+    with a cached name reuse that name's label. Requires the optional
+    numpy and sentence-transformers packages.
+    """
+
+    def __init__(
+        self,
+        path: str = ".label_cache_semantic",
+        model: str = "",
+        threshold: float = 0.92,
+        encoder_name: str = "all-MiniLM-L6-v2"
+    ):
+        """
+        Load the embedding model and any previously saved index.
+
+        Args:
+            path: Path prefix for the saved index (<path>.npy and <path>.json)
+            model: LLM model the cached labels were generated with; a saved
+                index built with a different model is ignored
+            threshold: Minimum cosine similarity for a cache hit
+            encoder_name: SentenceTransformer model used to embed field names;
+                a saved index built with a different encoder (or embedding
+                size) is ignored, since its vectors aren't comparable
+        """
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "The semantic label cache requires numpy and sentence-transformers. "
+                "Install them with: pip install sentence-transformers"
+            ) from e
+
+        self._np = np
+        self._encoder = SentenceTransformer(encoder_name)
+        self.model = model
+        self.encoder_name = encoder_name
+        self.threshold = threshold
+        self._index_path = Path(f"{path}.npy")
+        self._values_path = Path(f"{path}.json")
+
+        self._dim = self._encoder.get_sentence_embedding_dimension()
+        self._index = np.zeros((0, self._dim), dtype=np.float32)
+        self._values: List[Dict[str, str]] = []
+
+        if self._index_path.exists() and self._values_path.exists():
+            saved = orjson.loads(self._values_path.read_bytes())
+            if (
+                saved.get("model") == model
+                and saved.get("encoder_name") == encoder_name
+                and saved.get("dim") == self._dim
+            ):
+                index = np.load(self._index_path)
+                values = saved["values"]
+                if index.shape == (len(values), self._dim):
+                    self._index = index
+                    self._values = values
+
+    def _encode(self, field_names: List[str]) -> Any:
+        """Embed field names as unit-length float32 vectors."""
+        return self._encoder.encode(
+            field_names,
+            normalize_embeddings=True,
+            convert_to_numpy=True
+        ).astype(self._np.float32)
+
+    def lookup(self, field_names: List[str]) -> List[Optional[Dict[str, str]]]:
+        """
+        Find cached labels for paraphrases of the given field names.
+
+        Args:
+            field_names: Field names to look up
+
+        Returns:
+            List with the cached label/explanation, or None, for each name
+        """
+        if not field_names or not self._values:
+            return [None] * len(field_names)
+
+        # Embeddings are normalized, so one matmul gives all cosine similarities
+        similarities = self._encode(field_names) @ self._index.T
+        best = similarities.argmax(axis=1)
+
+        return [
+            self._values[idx] if similarities[row, idx] >= self.threshold else None
+            for row, idx in enumerate(best)
+        ]
+
+    def add(self, field_names: List[str], values: List[Dict[str, str]]) -> None:
+        """Add labels for the given field names to the index."""
+        if not field_names:
+            return
+        self._index = self._np.vstack([self._index, self._encode(field_names)])
+        self._values.extend(values)
+
+    def save(self) -> None:
+        """Write the index to disk."""
+        self._np.save(self._index_path, self._index)
+        self._values_path.write_bytes(
+            orjson.dumps({
+                "model": self.model,
+                "encoder_name": self.encoder_name,
+                "dim": self._dim,
+                "values": self._values
+            })
+        )
 
 
 class FieldProcessor:
     """Processes extracted form fields using LLM for intelligent analysis."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Number of field names labeled per LLM request
+    LABEL_BATCH_SIZE = 40
+
+    # Number of fields grouped per LLM request
+    GROUP_CHUNK_SIZE = 80
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 5,
+        requests_per_minute: Optional[int] = 50,
+        max_retries: int = 6,
+        label_cache_path: Optional[str] = ".label_cache.sqlite",
+        semantic_cache_path: Optional[str] = None
+    ):
         """
         Initialize the field processor.
 
         Args:
             api_key: Anthropic API key. If None, will use ANTHROPIC_API_KEY env variable.
+            max_concurrency: Maximum number of LLM requests in flight at once
+            requests_per_minute: Maximum number of LLM requests started per minute,
+                to stay under the account's rate limit. If None, not limited.
+            max_retries: Retries for rate-limited (429), overloaded and 5xx
+                responses, with exponential backoff
+            label_cache_path: SQLite file for caching generated labels across runs.
+                If None, labels are always regenerated.
+            semantic_cache_path: Path prefix for a SemanticLabelCache that reuses
+                labels across paraphrased field names. If None (default), only
+                exact field names are cached.
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -27,118 +611,96 @@ class FieldProcessor:
                 "Anthropic API key required. Set ANTHROPIC_API_KEY environment variable "
                 "or pass api_key parameter."
             )
-        self.client = Anthropic(api_key=self.api_key)
+        # The SDK retries 429/5xx/connection errors with jittered exponential
+        # backoff, honoring retry-after headers
+        self.client = Anthropic(api_key=self.api_key, max_retries=max_retries)
         self.model = "claude-sonnet-4-5-20250929"
+        self.max_concurrency = max(1, max_concurrency)
+        self._rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        self._label_cache = LabelCache(label_cache_path) if label_cache_path else None
+        self._semantic_cache = (
+            SemanticLabelCache(semantic_cache_path, model=self.model)
+            if semantic_cache_path else None
+        )
+
+    def _map_concurrent(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any]
+    ) -> List[Any]:
+        """
+        Apply func to each item, running up to max_concurrency calls at once.
+
+        LLM requests are network-bound, so a thread pool overlaps their latency.
+        The Anthropic client is thread-safe and can be shared by all workers.
+
+        Args:
+            func: Function to apply to each item
+            items: Items to process
+
+        Returns:
+            List of results in the same order as items
+        """
+        items = list(items)
+        workers = min(self.max_concurrency, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
 
-    def _parse_llm_json_response(
+    def _call_tool(
         self,
-        response_text: str,
+        instructions: str,
+        content: str,
+        tool: Dict[str, Any],
+        max_tokens: int,
         context: str = "LLM response"
-    ) -> Optional[Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        Parse JSON from LLM response with automatic error recovery.
+        Call the LLM and force it to answer through a single tool.
+
+        The tool's input_schema defines the expected response structure, so
+        the result arrives as already-parsed JSON. The static instructions are
+        sent as their own block ahead of the variable content. They are not
+        marked for prompt caching: tool plus instructions stay well below
+        the model's minimum cacheable prompt length, so a cache entry would
+        never be created.
 
         Args:
-            response_text: The response text from the LLM
-            context: Description of what's being parsed (for error messages)
+            instructions: Static task instructions, identical across calls
+            content: Variable part of the prompt (the fields to process)
+            tool: Tool definition whose input the LLM must produce
+            max_tokens: Maximum tokens for the response
+            context: Description of the request (for warnings)
 
         Returns:
-            Parsed JSON object or None if parsing fails
+            The tool input produced by the LLM, or None if it produced none
         """
-        # Remove markdown code blocks if present
-        text = response_text.strip()
-        if text.startswith("```"):
-            lines = text.split("\n")
-            text = "\n".join(lines[1:-1]) if len(lines) > 2 else text
-            if text.startswith("json"):
-                text = text[4:].strip()
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
 
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
-            print(f"Warning: Failed to parse {context}: {e}")
-            print(f"Response preview (first 500 chars):\n{text[:500]}")
-            if len(text) > 500:
-                print(f"Response preview (last 500 chars):\n{text[-500:]}")
-
-            # Try to fix common JSON issues
-            fixed_text = text
-
-            # Fix trailing commas before closing braces/brackets
-            fixed_text = re.sub(r',(\s*[}\]])', r'\1', fixed_text)
-
-            # Fix Python-style booleans (True/False -> true/false)
-            fixed_text = re.sub(r'\bTrue\b', 'true', fixed_text)
-            fixed_text = re.sub(r'\bFalse\b', 'false', fixed_text)
-            fixed_text = re.sub(r'\bNone\b', 'null', fixed_text)
-
-            # Fix single quotes to double quotes (but be careful with apostrophes in content)
-            # Only fix quotes around keys and simple string values
-            fixed_text = re.sub(r"'(\w+)'(\s*):", r'"\1"\2:', fixed_text)  # Fix keys
-
-            # Fix missing commas between objects in arrays/objects
-            fixed_text = re.sub(r'}\s*{', '},{', fixed_text)
-            fixed_text = re.sub(r']\s*\[', '],[', fixed_text)
-            fixed_text = re.sub(r'"\s*"(\w+)"(\s*):', r'","\1"\2:', fixed_text)
-
-            # Remove any text before first { or [
-            first_brace = fixed_text.find('{')
-            first_bracket = fixed_text.find('[')
-            if first_brace != -1 and (first_bracket == -1 or first_brace < first_bracket):
-                fixed_text = fixed_text[first_brace:]
-            elif first_bracket != -1:
-                fixed_text = fixed_text[first_bracket:]
-
-            # Remove any text after last } or ]
-            last_brace = fixed_text.rfind('}')
-            last_bracket = fixed_text.rfind(']')
-            if last_brace != -1 and last_brace > last_bracket:
-                fixed_text = fixed_text[:last_brace + 1]
-            elif last_bracket != -1:
-                fixed_text = fixed_text[:last_bracket + 1]
-
-            # Try parsing again
-            try:
-                result = json.loads(fixed_text)
-                print(f"✓ Successfully parsed {context} after automatic fixes")
-                return result
-            except json.JSONDecodeError as e2:
-                print(f"Still failed after attempted fixes: {e2}")
-
-                # Last resort: Try to extract partial valid JSON
-                # Find the error location and try to salvage what we can
-                try:
-                    # Try to find where the valid JSON ends
-                    error_pos = e2.pos if hasattr(e2, 'pos') else None
-                    if error_pos and error_pos > 100:
-                        # Try to parse up to the error point
-                        truncated = fixed_text[:error_pos]
-                        # Try to close any open structures
-                        for attempt in [
-                            truncated + '}',
-                            truncated + '}}',
-                            truncated + ']',
-                            truncated + ']}',
-                            truncated + '}]}',
-                        ]:
-                            try:
-                                result = json.loads(attempt)
-                                print(f"✓ Recovered partial JSON by truncating at error position")
-                                return result
-                            except:
-                                continue
-                except:
-                    pass
-
-                # Save failed response to file for debugging
-                try:
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json', prefix='failed_parse_') as f:
-                        f.write(fixed_text)
-                        print(f"Saved failed response to: {f.name}")
-                except Exception:
-                    pass
-                return None
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]},
+            messages=[{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": instructions},
+                    {"type": "text", "text": content}
+                ]
+            }]
+        )
+
+        if response.stop_reason == "max_tokens":
+            print(f"Warning: {context} truncated at {max_tokens} tokens")
+
+        for block in response.content:
+            if block.type == "tool_use":
+                return block.input
+        return None
 
     def process_fields(
         self,
@@ -186,11 +748,31 @@ class FieldProcessor:
         if not fields:
             return []
 
-        # Process in batches to avoid token limits
+        # Collapse fields whose names differ only in case, whitespace or
+        # punctuation locally, so the LLM only sees one of each
+        buckets = defaultdict(list)
+        for field in fields:
+            key = (_normalize_field_name(field["field_name"]), field.get("field_type", "text"))
+            buckets[key].append(field)
+
+        if len(buckets) < len(fields):
+            representatives = []
+            for bucket in buckets.values():
+                representative = bucket[0].copy()
+                representative["sources"] = list(dict.fromkeys(
+                    source
+                    for field in bucket
+                    for source in field.get("sources", [field["source_pdf"]])
+                ))
+                representatives.append(representative)
+            print(f"   {len(fields)} fields collapsed to {len(representatives)} distinct names")
+            fields = representatives
+
+        # Process in batches to avoid token limits. Batches are independent,
+        # so their LLM calls run concurrently; results keep the batch order.
+        batches = [fields[i:i + batch_size] for i in range(0, len(fields), batch_size)]
         all_deduplicated = []
-        for i in range(0, len(fields), batch_size):
-            batch = fields[i:i + batch_size]
-            deduplicated_batch = self._deduplicate_batch(batch)
+        for deduplicated_batch in self._map_concurrent(self._deduplicate_batch, batches):
             all_deduplicated.extend(deduplicated_batch)
 
         return all_deduplicated
@@ -207,58 +789,20 @@ class FieldProcessor:
                 "type": field.get("field_type", "text")
             })
 
-        prompt = f"""You are an expert at analyzing form fields. I have extracted fields from multiple PDF forms and need to identify which fields are duplicates or represent the same information.
-
-Here are the fields:
-{json.dumps(field_summary, indent=2)}
-
-Your task:
-1. Identify groups of fields that represent the SAME information (e.g., "Full Name", "Name", "Applicant Name" all mean the same thing)
-2. Be intelligent - not too strict (don't require exact string match) but not too loose (don't merge "First Name" with "Full Name")
-3. For each group, select the BEST field name to represent the group (clearest, most complete)
-
-Return a JSON array of groups. Each group should have:
-- "canonical_name": The best field name to use
-- "field_indices": Array of indices from the input that belong to this group
-- "reasoning": Brief explanation of why these are the same
-
-Example output format:
-[
-  {{
-    "canonical_name": "Full Name",
-    "field_indices": [0, 5, 12],
-    "reasoning": "All refer to the applicant's complete name"
-  }},
-  {{
-    "canonical_name": "Date of Birth",
-    "field_indices": [1],
-    "reasoning": "Unique field, no duplicates"
-  }}
-]
-
-IMPORTANT:
-- Respond with ONLY valid JSON - no markdown code blocks, no explanations
-- Do NOT use trailing commas
-- Ensure all strings are properly quoted with double quotes
-- The response must be parseable by json.loads() in Python"""
+        content = f"Here are the fields:\n{_prompt_json(field_summary)}"
 
         # For large field sets, we need more tokens
-        estimated_tokens = len(batch) * 60 + 500
+        estimated_tokens = len(fields) * 60 + 500
         max_tokens_needed = min(8192, max(4096, estimated_tokens))
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens_needed,
-            messages=[{"role": "user", "content": prompt}]
+        result = self._call_tool(
+            DEDUP_INSTRUCTIONS,
+            content,
+            DEDUP_TOOL,
+            max_tokens_needed,
+            "Deduplication response"
         )
-
-        # Parse LLM response
-        response_text = response.content[0].text.strip()
-
-        if response.stop_reason == "max_tokens":
-            print(f"Warning: Deduplication response truncated at {max_tokens_needed} tokens")
-
-        groups = self._parse_llm_json_response(response_text, "deduplication response")
+        groups = result.get("groups") if result else None
 
         if groups is None:
             # Fallback: treat each field as unique
@@ -267,7 +811,7 @@ IMPORTANT:
         # Merge fields based on LLM grouping
         deduplicated = []
         for group in groups:
-            indices = group["field_indices"]
+            indices = [idx for idx in group["field_indices"] if 0 <= idx < len(fields)]
             if not indices:
                 continue
 
@@ -275,9 +819,13 @@ IMPORTANT:
             base_field = fields[indices[0]].copy()
             base_field["field_name"] = group["canonical_name"]
 
-            # Collect source PDFs
-            sources = [fields[idx]["source_pdf"] for idx in indices]
-            base_field["sources"] = list(set(sources))
+            # Collect source PDFs, including those already merged locally
+            sources = [
+                source
+                for idx in indices
+                for source in fields[idx].get("sources", [fields[idx]["source_pdf"]])
+            ]
+            base_field["sources"] = list(dict.fromkeys(sources))  # dedupe, keep order
 
             deduplicated.append(base_field)
 
@@ -288,10 +836,54 @@ IMPORTANT:
         Use LLM to group related fields together.
 
         For example: first_name, middle_name, last_name -> name group
+
+        Large field lists are grouped in chunks of GROUP_CHUNK_SIZE fields so
+        each response fits in the output token budget; the chunk results are
+        then merged by consolidating synonymous group names.
         """
         if not fields:
             return []
 
+        chunks = [
+            (start, fields[start:start + self.GROUP_CHUNK_SIZE])
+            for start in range(0, len(fields), self.GROUP_CHUNK_SIZE)
+        ]
+        groups = [
+            group
+            for chunk_groups in self._map_concurrent(self._group_fields_chunk, chunks)
+            for group in chunk_groups
+        ]
+
+        if len(chunks) > 1:
+            groups = self._merge_groups(groups)
+
+        # Add group information to fields (_group_id is temporary, used later for
+        # order_index). Range membership is an O(1) check for ints.
+        valid_indices = range(len(fields))
+        grouped_fields = [
+            {**fields[field_idx], "_group_id": group_id}
+            for group_id, group in enumerate(groups)
+            for field_idx in group["field_indices"]
+            if field_idx in valid_indices
+        ]
+
+        return grouped_fields
+
+    def _group_fields_chunk(
+        self,
+        chunk: Tuple[int, List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Group a single chunk of fields.
+
+        Args:
+            chunk: Tuple of (offset of the chunk in the full field list, fields)
+
+        Returns:
+            List of groups whose field_indices refer to the full field list
+        """
+        offset, fields = chunk
+
         field_summary = []
         for idx, field in enumerate(fields):
             field_summary.append({
@@ -300,74 +892,78 @@ IMPORTANT:
                 "type": field.get("field_type", "text")
             })
 
-        prompt = f"""You are an expert at organizing form fields. I need to group related fields together for better UI rendering.
-
-Here are the fields:
-{json.dumps(field_summary, indent=2)}
-
-Your task:
-1. Identify fields that should be grouped together (e.g., First Name, Middle Name, Last Name form a "name" group)
-2. Common groups include: name, address, contact, employment, spouse, children, etc.
-3. Each field should belong to exactly one group
-4. Create meaningful group names
-
-Return a JSON array where each element has:
-- "group_name": Name of the group (e.g., "name", "address")
-- "field_indices": Array of field indices that belong to this group
-- "description": Brief description of what this group represents
-
-Example:
-[
-  {{
-    "group_name": "name",
-    "field_indices": [0, 1, 2],
-    "description": "Applicant's full name components"
-  }},
-  {{
-    "group_name": "address",
-    "field_indices": [3, 4, 5, 6, 7],
-    "description": "Residential address fields"
-  }}
-]
-
-IMPORTANT:
-- Respond with ONLY valid JSON - no markdown code blocks, no explanations
-- Do NOT use trailing commas
-- Ensure all strings are properly quoted with double quotes
-- The response must be parseable by json.loads() in Python"""
+        content = f"Here are the fields:\n{_prompt_json(field_summary)}"
 
         # For large field sets, we need more tokens
         estimated_tokens = len(fields) * 40 + 500
         max_tokens_needed = min(8192, max(4096, estimated_tokens))
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens_needed,
-            messages=[{"role": "user", "content": prompt}]
+        result = self._call_tool(
+            GROUP_INSTRUCTIONS,
+            content,
+            GROUP_TOOL,
+            max_tokens_needed,
+            "Grouping response"
         )
+        groups = result.get("groups") if result else None
 
-        response_text = response.content[0].text.strip()
+        if groups is None:
+            # Fallback: each field in its own group. Names use the index in
+            # the full field list so fallback groups of different chunks
+            # don't share a name and get merged.
+            groups = [{"group_name": f"group_{offset + idx}", "field_indices": [idx], "description": ""}
+                      for idx in range(len(fields))]
 
-        if response.stop_reason == "max_tokens":
-            print(f"Warning: Grouping response truncated at {max_tokens_needed} tokens")
+        # Translate chunk-local indices to indices in the full field list
+        valid_indices = range(len(fields))
+        return [
+            {
+                **group,
+                "field_indices": [
+                    offset + idx for idx in group["field_indices"] if idx in valid_indices
+                ]
+            }
+            for group in groups
+        ]
 
-        groups = self._parse_llm_json_response(response_text, "grouping response")
+    def _merge_groups(self, groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merge groups from separately grouped chunks.
 
-        if groups is None:
-            # Fallback: each field in its own group
-            groups = [{"group_name": f"group_{idx}", "field_indices": [idx], "description": ""}
-                      for idx in range(len(fields))]
+        Asks the LLM to map synonymous group names (e.g. "name" and
+        "applicant_name") to one canonical name, then combines groups that
+        share a canonical name. Groups keep the order of their first appearance.
+        """
+        group_names = list(dict.fromkeys(group["group_name"] for group in groups))
 
-        # Add group information to fields (using group_id for order_index assignment later)
-        grouped_fields = []
-        for group_id, group in enumerate(groups):
-            for field_idx in group["field_indices"]:
-                if field_idx < len(fields):
-                    field = fields[field_idx].copy()
-                    field["_group_id"] = group_id  # Temporary, will be used for order_index
-                    grouped_fields.append(field)
+        content = f"Here are the group names:\n{_prompt_json(group_names)}"
+        max_tokens_needed = min(8192, max(1024, len(group_names) * 30 + 500))
 
-        return grouped_fields
+        result = self._call_tool(
+            GROUP_MERGE_INSTRUCTIONS,
+            content,
+            GROUP_MERGE_TOOL,
+            max_tokens_needed,
+            "Group merge response"
+        )
+        mapping = result.get("mapping") if result else None
+        if not isinstance(mapping, dict):
+            # Fallback: only merge groups with identical names
+            mapping = {}
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for group in groups:
+            canonical = mapping.get(group["group_name"]) or group["group_name"]
+            if canonical in merged:
+                merged[canonical]["field_indices"].extend(group["field_indices"])
+            else:
+                merged[canonical] = {
+                    **group,
+                    "group_name": canonical,
+                    "field_indices": list(group["field_indices"])
+                }
+
+        return list(merged.values())
 
     def _generate_conditional_logic(
         self,
@@ -385,95 +981,21 @@ IMPORTANT:
                 "field_name": field["field_name"]
             })
 
-        prompt = f"""You are an expert at designing smart forms. I need to create a decision tree for form fields to avoid showing irrelevant questions.
-
-Here are the fields:
-{json.dumps(field_summary, indent=2)}
-
-Your task:
-1. Identify patterns where multiple fields could be controlled by a single parent question
-2. For example: if there are spouse1, spouse2... spouse6 fields, create a parent question "Are you married?" or "How many spouses?"
-3. For example: if there are child1, child2... fields, create "Do you have children?" and "How many children?"
-4. Create logical parent-child relationships WITH condition values
-
-Return a JSON object with:
-- "parent_questions": Array of new high-level questions to add
-  Each has: {{
-    "question_id": unique ID,
-    "label": The question to ask,
-    "type": "boolean", "number", or "choice",
-    "options": (if type is choice)
-  }}
-- "field_relationships": Object mapping field indices to their condition
-  Each has: {{
-    "parent_id": parent question ID,
-    "condition": {{
-      "operator": "equals", "greater_than", "greater_or_equal", "less_than", "less_or_equal", "not_equals",
-      "value": the value to compare against
-    }}
-  }}
-
-Example:
-{{
-  "parent_questions": [
-    {{
-      "question_id": "are_you_married",
-      "label": "Are you married?",
-      "type": "boolean"
-    }},
-    {{
-      "question_id": "num_children",
-      "label": "How many children do you have?",
-      "type": "number"
-    }}
-  ],
-  "field_relationships": {{
-    "5": {{
-      "parent_id": "are_you_married",
-      "condition": {{"operator": "equals", "value": true}}
-    }},
-    "6": {{
-      "parent_id": "are_you_married",
-      "condition": {{"operator": "equals", "value": true}}
-    }},
-    "10": {{
-      "parent_id": "num_children",
-      "condition": {{"operator": "greater_than", "value": 0}}
-    }},
-    "11": {{
-      "parent_id": "num_children",
-      "condition": {{"operator": "greater_or_equal", "value": 2}}
-    }}
-  }}
-}}
-
-IMPORTANT:
-- Respond with ONLY valid JSON - no markdown code blocks, no explanations
-- Do NOT use trailing commas
-- Ensure all strings are properly quoted with double quotes
-- The response must be parseable by json.loads() in Python
-- Boolean values should be true/false (lowercase), not True/False"""
+        content = f"Here are the fields:\n{_prompt_json(field_summary)}"
 
         # For large field sets, we need more tokens
         # Estimate: ~50-80 tokens per field relationship
         estimated_tokens = len(fields) * 80 + 1000  # +1000 for parent questions
         max_tokens_needed = min(8192, max(4096, estimated_tokens))
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens_needed,
-            messages=[{"role": "user", "content": prompt}]
+        conditional_logic = self._call_tool(
+            CONDITIONAL_LOGIC_INSTRUCTIONS,
+            content,
+            CONDITIONAL_LOGIC_TOOL,
+            max_tokens_needed,
+            "Conditional logic response"
         )
 
-        response_text = response.content[0].text.strip()
-
-        # Check if response was truncated
-        if response.stop_reason == "max_tokens":
-            print(f"Warning: Response was truncated at {max_tokens_needed} tokens")
-            print("Some conditional logic may be incomplete. Consider processing fewer fields at once.")
-
-        conditional_logic = self._parse_llm_json_response(response_text, "conditional logic response")
-
         if conditional_logic is None:
             conditional_logic = {"parent_questions": [], "field_relationships": {}}
 
@@ -495,16 +1017,31 @@ IMPORTANT:
             }
 
         # Add all fields with enhanced metadata
-        relationships = conditional_logic.get("field_relationships", {})
+        # Relationship keys are field indices sent as strings; convert them once
+        relationships = {}
+        for key, relationship in conditional_logic.get("field_relationships", {}).items():
+            try:
+                relationships[int(key)] = relationship
+            except (TypeError, ValueError):
+                print(f"Warning: Ignoring relationship for invalid field index {key!r}")
+
+        # Compute per-field values once up front
+        field_names = [field["field_name"] for field in fields]
+        placeholders = [f"Enter your {field_name.lower()}" for field_name in field_names]
+        sources = [field.get("sources", [field.get("source_pdf")]) for field in fields]
+
+        # Generate user-friendly labels and explanations concurrently
+        labels = self._generate_labels(field_names)
+
         for idx, field in enumerate(fields):
-            # Generate user-friendly label and explanation
-            label_explanation = self._generate_label_and_explanation(field["field_name"])
+            label_explanation = labels[idx]
+            field_name = field_names[idx]
 
             # Use _group_id for order_index (fields in same group get same order_index)
             order_index = field.get("_group_id", idx)
 
             # Extract parent relationship and condition
-            relationship = relationships.get(str(idx))
+            relationship = relationships.get(idx)
             parent_id = None
             parent_condition = None
 
@@ -517,10 +1054,10 @@ IMPORTANT:
                     # Legacy format (just parent ID string)
                     parent_id = relationship
 
-            field_key = field["field_name"]
+            field_key = field_name
             metadata = {
-                "field_name": field["field_name"],
-                "source_pdf": field.get("sources", [field.get("source_pdf")]),
+                "field_name": field_name,
+                "source_pdf": sources[idx],
                 "order_index": order_index,
                 "parent": parent_id,
                 "position": None
@@ -535,7 +1072,7 @@ IMPORTANT:
                 "explanation": label_explanation["explanation"],
                 "type": field.get("field_type", "text"),
                 "required": field.get("required", False),
-                "placeholder": f"Enter your {field['field_name'].lower()}",
+                "placeholder": placeholders[idx],
                 "_metadata": metadata
             }
 
@@ -549,51 +1086,120 @@ IMPORTANT:
 
         return output
 
-    def _generate_label_and_explanation(self, field_name: str) -> Dict[str, str]:
-        """Generate user-friendly label and explanation for a field."""
-        prompt = f"""Given the form field name "{field_name}", create:
-1. A clear, user-friendly question/label
-2. A helpful explanation that guides the user on how to fill it
+    def _generate_labels(self, field_names: List[str]) -> List[Dict[str, str]]:
+        """
+        Generate labels and explanations for many fields.
 
-Return JSON only:
-{{
-  "label": "question here",
-  "explanation": "helpful explanation here"
-}}
+        Common, cached and repeated names are resolved up front, so only the
+        remaining unique names are sent to the LLM.
 
-Make it clear and professional. For example:
-- Field "DOB" -> label: "What is your date of birth?", explanation: "Enter your date of birth as it appears on your birth certificate (MM/DD/YYYY)"
-- Field "Applicant Full Name" -> label: "What is your full name?", explanation: "Enter your complete legal name as it appears on official documents"
+        Args:
+            field_names: Field names to label
 
-IMPORTANT:
-- Respond with ONLY valid JSON - no markdown code blocks, no explanations
-- Do NOT use trailing commas
-- Ensure all strings are properly quoted with double quotes
-- The response must be parseable by json.loads() in Python"""
+        Returns:
+            List of label/explanation dicts in the same order as field_names
+        """
+        results = {}
+        missing = []
+        for field_name in dict.fromkeys(field_names):
+            common = COMMON_LABELS.get(_normalize_field_name(field_name))
+            if common:
+                results[field_name] = dict(common)
+                continue
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=512,
-                messages=[{"role": "user", "content": prompt}]
+            cached = None
+            if self._label_cache:
+                cached = self._label_cache.get(LabelCache.make_key(self.model, field_name))
+            if cached:
+                results[field_name] = cached
+            else:
+                missing.append(field_name)
+
+        # Reuse labels of previously seen paraphrases ("Name of Applicant" vs
+        # "Applicant Name") before falling back to the LLM
+        if self._semantic_cache and missing:
+            matches = self._semantic_cache.lookup(missing)
+            results.update(
+                (field_name, match) for field_name, match in zip(missing, matches) if match
             )
-
-            response_text = response.content[0].text.strip()
-            result = self._parse_llm_json_response(response_text, f"label for '{field_name}'")
-
+            missing = [field_name for field_name in missing if field_name not in results]
+
+        # Label many fields per request. Each chunk falls back on its own
+        # failure, so one bad request never aborts the rest.
+        chunks = [
+            missing[i:i + self.LABEL_BATCH_SIZE]
+            for i in range(0, len(missing), self.LABEL_BATCH_SIZE)
+        ]
+        generated = {}
+        for chunk_labels in self._map_concurrent(self._generate_labels_batch, chunks):
+            generated.update(chunk_labels)
+
+        new_labels = {}
+        for field_name in missing:
+            result = generated.get(field_name)
             if result:
-                return result
+                new_labels[field_name] = result
+                if self._label_cache:
+                    self._label_cache.set(LabelCache.make_key(self.model, field_name), result)
             else:
-                # Fallback
-                return {
-                    "label": f"What is your {field_name.lower()}?",
-                    "explanation": f"Enter your {field_name.lower()}"
-                }
+                result = self._fallback_label(field_name)
+            results[field_name] = result
 
+        if self._semantic_cache and new_labels:
+            self._semantic_cache.add(list(new_labels), list(new_labels.values()))
+            self._semantic_cache.save()
+
+        return [results[field_name] for field_name in field_names]
+
+    def _generate_label_and_explanation(self, field_name: str) -> Dict[str, str]:
+        """Generate user-friendly label and explanation for a field."""
+        return self._generate_labels([field_name])[0]
+
+    @staticmethod
+    def _fallback_label(field_name: str) -> Dict[str, str]:
+        """Build a generic label for a field when the LLM cannot provide one."""
+        return {
+            "label": f"What is your {field_name.lower()}?",
+            "explanation": f"Enter your {field_name.lower()}"
+        }
+
+    def _generate_labels_batch(self, field_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Ask the LLM for labels and explanations of several fields in one request.
+
+        Args:
+            field_names: Field names to label
+
+        Returns:
+            Mapping of field name to label/explanation for every name the LLM
+            answered. Names missing from the response (or all names, if the
+            request fails) are omitted.
+        """
+        content = f"Here are the field names:\n{_prompt_json(field_names)}"
+
+        # Roughly 100 tokens per label/explanation pair
+        max_tokens_needed = min(8192, max(1024, len(field_names) * 100 + 200))
+
+        try:
+            result = self._call_tool(
+                LABEL_INSTRUCTIONS,
+                content,
+                LABEL_TOOL,
+                max_tokens_needed,
+                "Label response"
+            )
         except Exception as e:
-            print(f"Warning: Failed to generate label for {field_name}: {e}")
-            # Fallback
-            return {
-                "label": f"What is your {field_name.lower()}?",
-                "explanation": f"Enter your {field_name.lower()}"
-            }
+            print(f"Warning: Failed to generate labels for {len(field_names)} fields: {e}")
+            return {}
+
+        labels = result.get("labels") if result else None
+        if not isinstance(labels, dict):
+            return {}
+
+        return {
+            field_name: labels[field_name]
+            for field_name in field_names
+            if isinstance(labels.get(field_name), dict)
+            and "label" in labels[field_name]
+            and "explanation" in labels[field_name]
+        }
@@ -15,10 +15,12 @@ Example:
 """
 
 import argparse
-import json
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
+import orjson
 from dotenv import load_dotenv
 
 from pdf_acroform_extractor import extract_acroforms
@@ -68,6 +70,45 @@ def parse_arguments():
         help="Number of fields to process per LLM batch (default: 50)"
     )
 
+    # Extraction workers option
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of workers used to extract PDFs "
+             "(default: CPU count, or one per file for fewer than 8 PDFs)"
+    )
+
+    # Concurrency option
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent LLM requests (default: 5)"
+    )
+
+    # Rate limit option
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=50,
+        help="Maximum LLM requests started per minute, 0 for no limit (default: 50)"
+    )
+
+    # Label cache option
+    parser.add_argument(
+        "--no-label-cache",
+        action="store_true",
+        help="Do not reuse or store generated labels in .label_cache.sqlite"
+    )
+
+    parser.add_argument(
+        "--semantic-label-cache",
+        action="store_true",
+        help="Also reuse labels across paraphrased field names "
+             "(requires sentence-transformers)"
+    )
+
     # Skip processing option
     parser.add_argument(
         "--extract-only",
@@ -75,7 +116,25 @@ def parse_arguments():
         help="Only extract fields, skip LLM processing"
     )
 
-    return parser.parse_args()
+    # Verbosity option
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Report each PDF as it is extracted"
+    )
+
+    args = parser.parse_args()
+    if args.requests_per_minute < 0:
+        parser.error("--requests-per-minute must be 0 (no limit) or more")
+
+    return args
+
+
+def check_pdf_path(path: str) -> Tuple[Path, bool]:
+    """Return the path and whether it exists."""
+    p = Path(path)
+    return p, p.exists()
 
 
 def load_pdf_paths(args) -> List[str]:
@@ -94,11 +153,14 @@ def load_pdf_paths(args) -> List[str]:
         # Use direct arguments
         paths = args.pdf_files
 
-    # Validate paths
+    # Validate paths. Each exists() check is a stat() syscall that releases
+    # the GIL, so a thread pool overlaps them on slow or network filesystems.
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(paths)))) as executor:
+        checked = list(executor.map(check_pdf_path, paths))
+
     valid_paths = []
-    for path in paths:
-        p = Path(path)
-        if not p.exists():
+    for path, (p, exists) in zip(paths, checked):
+        if not exists:
             print(f"Warning: PDF not found, skipping: {path}")
         elif not p.suffix.lower() == '.pdf':
             print(f"Warning: Not a PDF file, skipping: {path}")
@@ -120,6 +182,12 @@ def main():
     # Parse arguments
     args = parse_arguments()
 
+    # Extraction progress is logged; other libraries only report warnings
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    logging.getLogger("pdf_acroform_extractor").setLevel(
+        logging.DEBUG if args.verbose else logging.INFO
+    )
+
     # Load PDF paths
     pdf_paths = load_pdf_paths(args)
 
@@ -132,7 +200,7 @@ def main():
     # Step 1: Extract acroforms from PDFs
     print("\n[STEP 1] Extracting acroforms from PDFs...")
     try:
-        extracted_fields = extract_acroforms(pdf_paths)
+        extracted_fields = extract_acroforms(pdf_paths, max_workers=args.workers)
     except Exception as e:
         print(f"Error extracting acroforms: {e}")
         sys.exit(1)
@@ -147,15 +215,21 @@ def main():
             "total_fields": len(extracted_fields),
             "fields": extracted_fields
         }
-        with open(args.output, 'w') as f:
-            json.dump(raw_output, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(orjson.dumps(raw_output, option=orjson.OPT_INDENT_2))
         print(f"\n✓ Raw extraction saved to {args.output}")
         return
 
     # Step 2: Process fields with LLM
     print("\n[STEP 2] Processing fields with LLM...")
     try:
-        processor = FieldProcessor(api_key=args.api_key)
+        processor = FieldProcessor(
+            api_key=args.api_key,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute or None,
+            label_cache_path=None if args.no_label_cache else ".label_cache.sqlite",
+            semantic_cache_path=".label_cache_semantic" if args.semantic_label_cache else None
+        )
         combined_forms = processor.process_fields(
             extracted_fields,
             batch_size=args.batch_size
@@ -167,8 +241,8 @@ def main():
     # Step 3: Save output
     print(f"\n[STEP 3] Saving output to {args.output}...")
     try:
-        with open(args.output, 'w') as f:
-            json.dump(combined_forms, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(orjson.dumps(combined_forms, option=orjson.OPT_INDENT_2))
         print(f"✓ Successfully saved {len(combined_forms)} fields to {args.output}")
     except Exception as e:
         print(f"Error saving output: {e}")
@@ -181,17 +255,17 @@ def main():
     print(f"Total fields extracted: {len(extracted_fields)}")
     print(f"Final combined fields: {len(combined_forms)}")
 
-    # Count parent questions
-    parent_count = sum(1 for v in combined_forms.values()
-                       if v.get("_metadata", {}).get("is_parent_question"))
-    print(f"Generated parent questions: {parent_count}")
-
-    # Count unique order_index values (groups)
+    # Count parent questions and unique order_index values (groups) in one pass
+    parent_count = 0
     order_indices = set()
     for v in combined_forms.values():
-        order_idx = v.get("_metadata", {}).get("order_index")
+        metadata = v.get("_metadata") or {}
+        if metadata.get("is_parent_question"):
+            parent_count += 1
+        order_idx = metadata.get("order_index")
         if order_idx is not None:
             order_indices.add(order_idx)
+    print(f"Generated parent questions: {parent_count}")
     print(f"Field groups (unique order_index): {len(order_indices)}")
 
     print("\n✓ Processing complete!")
@@ -3,17 +3,117 @@ PDF Acroform Extractor
 Extracts form fields (acroforms) from PDF files.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import logging
+import logging.handlers
+import mmap
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING, List, Dict, Any, Callable, NamedTuple, Optional, Iterable, Iterator,
+    Tuple, BinaryIO, Union, cast
+)
 from pathlib import Path
 import pypdf
 from pypdf.generic import DictionaryObject
 
+try:
+    import pikepdf
+except ImportError:  # pikepdf is optional; pypdf is used without it
+    pikepdf = None  # type: ignore[assignment]
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # only needed when compiling with mypyc
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[Any], Any]:  # type: ignore[misc]
+        return lambda cls: cls
+
+if TYPE_CHECKING:  # optional output formats, imported where used
+    import pandas
+    import pyarrow
+
+logger = logging.getLogger(__name__)
+
+# Batches smaller than this are extracted in threads: starting worker
+# processes would cost more than it saves, while threads still overlap
+# the files' reads
+_THREAD_POOL_MAX_FILES = 8
+
+
+# Field type (/FT) values and their names in the extracted data
+_FT_MAP = {
+    "/Tx": "text",
+    "/Btn": "button",
+    "/Ch": "choice",
+    "/Sig": "signature",
+}
+
+
+class AcroField(NamedTuple):
+    """
+    One extracted form field.
+
+    An immutable, hashable record: a tuple with named fields, several
+    times smaller than the equivalent dictionary and cheap to pickle
+    between processes. to_dict() gives the dictionary form the
+    list-of-dict APIs return.
+    """
+
+    field_name: str
+    source_pdf: str
+    field_type: str
+    required: bool
+    value: Optional[str]
+    options: Optional[Tuple[str, ...]]
+    max_length: Optional[int]
+    page: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the field as a dictionary with the same keys."""
+        return {
+            "field_name": self.field_name,
+            "source_pdf": self.source_pdf,
+            "field_type": self.field_type,
+            "required": self.required,
+            "value": self.value,
+            "options": list(self.options) if self.options is not None else None,
+            "max_length": self.max_length,
+            "page": self.page,
+        }
+
+
+def _legacy_as_dicts(fields: Iterable[AcroField]) -> List[Dict[str, Any]]:
+    """Convert records into the list of dictionaries the original API returns."""
+    return [field.to_dict() for field in fields]
+
 
 class PDFAcroformExtractor:
-    """Extracts acroform fields from PDF files."""
+    """
+    Extracts acroform fields from PDF files.
 
-    def __init__(self):
-        self.extracted_fields = []
+    An extractor holds nothing but its backend choice, so one instance can be
+    shared freely between threads.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            backend: PDF library used to read fields, "pikepdf" or "pypdf".
+                Defaults to pikepdf (QPDF, C++) when installed, else pypdf.
+        """
+        if backend is None:
+            backend = "pikepdf" if pikepdf is not None else "pypdf"
+        if backend not in ("pikepdf", "pypdf"):
+            raise ValueError(f"Unknown PDF backend: {backend}")
+        if backend == "pikepdf" and pikepdf is None:
+            raise ImportError("The pikepdf backend requires: pip install pikepdf")
+
+        self._backend = backend
 
     def extract_from_file(self, pdf_path: str) -> List[Dict[str, Any]]:
         """
@@ -25,164 +125,622 @@ class PDFAcroformExtractor:
         Returns:
             List of field dictionaries with metadata
         """
-        path = Path(pdf_path)
-        if not path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        return _legacy_as_dicts(self.iter_records_from_file(pdf_path))
+
+    def extract_records_from_file(self, pdf_path: str) -> List[AcroField]:
+        """
+        Extract acroform fields from a single PDF file as AcroField records.
+
+        Args:
+            pdf_path: Path to the PDF file
 
-        fields = []
+        Returns:
+            List of field records
+        """
+        return list(self.iter_records_from_file(pdf_path))
+
+    def iter_from_file(self, pdf_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the acroform fields of a single PDF file one at a time.
+
+        The file stays open until the generator is exhausted or closed.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Yields:
+            Field dictionaries with metadata
+        """
+        for field in self.iter_records_from_file(pdf_path):
+            yield field.to_dict()
+
+    def iter_records_from_file(self, pdf_path: str) -> Iterator[AcroField]:
+        """
+        Yield the acroform fields of a single PDF file as AcroField records.
+
+        The file stays open until the generator is exhausted or closed.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Yields:
+            Field records
+        """
+        # No separate exists() check: opening the file raises
+        # FileNotFoundError for a missing path without the extra stat()
+        path = Path(pdf_path)
 
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = pypdf.PdfReader(file)
+            if self._backend == "pikepdf":
+                yield from self._iter_with_pikepdf(path)
+                return
+
+            with open(pdf_path, 'rb') as file, _map_file(file) as stream:
+                if isinstance(stream, mmap.mmap):
+                    _advise_random_access(stream)
+
+                # pypdf only needs read/seek/tell, which mmap provides
+                reader = pypdf.PdfReader(cast(BinaryIO, stream))
 
-                # Check if PDF has form fields
-                if reader.get_form_text_fields() is None and reader.get_fields() is None:
-                    print(f"Warning: No form fields found in {path.name}")
-                    return fields
+                # Check if PDF has form fields: a single catalog lookup, no
+                # walk of the field tree
+                if "/AcroForm" not in cast(DictionaryObject, reader.trailer["/Root"]):
+                    logger.warning("No form fields found in %s", path.name)
+                    return
 
-                # Get all fields
+                # Get all fields (walks the field tree exactly once)
                 form_fields = reader.get_fields()
                 if form_fields:
+                    # Every field of this file shares one source_pdf string
+                    source_pdf = sys.intern(path.name)
                     for field_name, field_info in form_fields.items():
-                        field_data = self._extract_field_info(
+                        yield self._extract_field_info(
                             field_name,
                             field_info,
-                            path.name
+                            source_pdf
                         )
-                        fields.append(field_data)
 
+        except FileNotFoundError:
+            raise
         except Exception as e:
-            print(f"Error processing {pdf_path}: {str(e)}")
+            logger.error("Error processing %s: %s", pdf_path, e)
             raise
 
-        return fields
+    def iter_from_multiple_files(self, pdf_paths: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the acroform fields of multiple PDF files one at a time.
+
+        Files are read serially, in input order, so at most one file's
+        fields are held in memory. Use extract_from_multiple_files to parse
+        files in parallel. Missing files are reported and skipped.
+
+        Args:
+            pdf_paths: List of paths to PDF files
+
+        Yields:
+            Field dictionaries with metadata
+        """
+        for field in self.iter_records_from_multiple_files(pdf_paths):
+            yield field.to_dict()
+
+    def iter_records_from_multiple_files(self, pdf_paths: List[str]) -> Iterator[AcroField]:
+        """
+        Yield the acroform fields of multiple PDF files as AcroField records.
+
+        Reads files serially, in input order, like iter_from_multiple_files.
+
+        Args:
+            pdf_paths: List of paths to PDF files
 
-    def extract_from_multiple_files(self, pdf_paths: List[str]) -> List[Dict[str, Any]]:
+        Yields:
+            Field records
+        """
+        for pdf_path in pdf_paths:
+            try:
+                yield from self.iter_records_from_file(pdf_path)
+            except FileNotFoundError:
+                logger.warning("PDF file not found, skipping: %s", pdf_path)
+
+    def extract_from_multiple_files(
+        self,
+        pdf_paths: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Extract acroform fields from multiple PDF files.
 
+        See extract_records_from_multiple_files for how files are processed.
+
+        Args:
+            pdf_paths: List of paths to PDF files
+            max_workers: Maximum number of workers (default: CPU count, or
+                one per file for small batches). Use 1 to extract serially
+                in the current process.
+
+        Returns:
+            Combined list of all fields from all PDFs with metadata, in input
+            file order
+        """
+        return _legacy_as_dicts(
+            self.extract_records_from_multiple_files(pdf_paths, max_workers)
+        )
+
+    def extract_records_from_multiple_files(
+        self,
+        pdf_paths: List[str],
+        max_workers: Optional[int] = None
+    ) -> List[AcroField]:
+        """
+        Extract acroform fields from multiple PDF files as AcroField records.
+
+        PDF parsing is CPU-bound, so files are parsed in parallel worker
+        processes. As with any multiprocessing code, scripts calling this
+        should guard their entry point with `if __name__ == "__main__":`.
+        Batches of fewer than 8 files are extracted in threads instead,
+        which overlaps reading the files without the cost of starting
+        processes.
+
         Args:
             pdf_paths: List of paths to PDF files
+            max_workers: Maximum number of workers (default: CPU count, or
+                one per file for small batches). Use 1 to extract serially
+                in the current process.
+
+        Missing files are reported and skipped rather than aborting the batch.
 
         Returns:
-            Combined list of all fields from all PDFs with metadata
+            Combined list of field records from all PDFs, in input file order
         """
+        use_threads = len(pdf_paths) < _THREAD_POOL_MAX_FILES
+        default_workers = len(pdf_paths) if use_threads else os.cpu_count() or 1
+        workers = min(max_workers or default_workers, len(pdf_paths))
+        if workers <= 1:
+            all_fields: List[AcroField] = []
+            all_fields_extend = all_fields.extend
+            for pdf_path in pdf_paths:
+                try:
+                    fields = self.extract_records_from_file(pdf_path)
+                except FileNotFoundError:
+                    logger.warning("PDF file not found, skipping: %s", pdf_path)
+                    continue
+                all_fields_extend(fields)
+                logger.debug("Extracted %d fields from %s", len(fields), pdf_path)
+
+            logger.info("Total fields extracted: %d", len(all_fields))
+            return all_fields
+
+        listener: Optional[logging.handlers.QueueListener] = None
+        executor: Executor
+        task: Callable[..., List[AcroField]]
+        task_args: Tuple[Any, ...]
+        if use_threads:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            task, task_args = self.extract_records_from_file, ()
+        else:
+            # Workers send their log records to the parent through a queue,
+            # where one listener thread hands them to this process's handlers
+            log_queue: "multiprocessing.Queue[logging.LogRecord]" = multiprocessing.Queue()
+            listener = logging.handlers.QueueListener(log_queue, _ForwardHandler())
+            listener.start()
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logger.getEffectiveLevel())
+            )
+            task, task_args = _extract_one, (self._backend,)
+
+        # Read ahead a window of files past those the workers are parsing.
+        # Workers take files in input order, so each finished file moves the
+        # window on by one; a bounded window keeps large batches from
+        # evicting files from the page cache before they are parsed.
+        prefetched = min(workers * _PREFETCH_FILES_PER_WORKER, len(pdf_paths))
+        _prefetch(pdf_paths[:prefetched])
+
+        # Report files as they finish, but keep results in input order
+        results: Dict[int, List[AcroField]] = {}
+        try:
+            with executor:
+                futures = {
+                    executor.submit(task, pdf_path, *task_args): idx
+                    for idx, pdf_path in enumerate(pdf_paths)
+                }
+                for future in as_completed(futures):
+                    if prefetched < len(pdf_paths):
+                        _prefetch(pdf_paths[prefetched:prefetched + 1])
+                        prefetched += 1
+
+                    idx = futures[future]
+                    try:
+                        results[idx] = future.result()
+                    except FileNotFoundError:
+                        logger.warning("PDF file not found, skipping: %s", pdf_paths[idx])
+                        results[idx] = []
+                        continue
+                    except BaseException:
+                        # Leaving the with block waits for every queued file;
+                        # cancel those not started so the error surfaces now.
+                        # (shutdown(cancel_futures=True) needs Python 3.9.)
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    logger.debug(
+                        "Extracted %d fields from %s", len(results[idx]), pdf_paths[idx]
+                    )
+        finally:
+            if listener is not None:
+                listener.stop()
+
         all_fields = []
+        all_fields_extend = all_fields.extend
+        for idx in range(len(pdf_paths)):
+            all_fields_extend(results[idx])
 
-        for pdf_path in pdf_paths:
-            print(f"Processing: {pdf_path}")
-            fields = self.extract_from_file(pdf_path)
+        logger.info("Total fields extracted: %d", len(all_fields))
+        return all_fields
+
+    @staticmethod
+    def _iter_with_pikepdf(path: Path) -> Iterator[AcroField]:
+        """
+        Yield acroform fields using pikepdf.
+
+        Reads /Root/AcroForm/Fields directly, without touching page content.
+        Produces the same fields as the pypdf backend: every field dictionary
+        with a /T (or /TM) entry, keyed by its fully qualified name. Like
+        pypdf's get_fields(), when several fields share a qualified name only
+        the last one is kept, at the position of the first.
+        """
+        with pikepdf.open(path) as pdf:
+            acroform = pdf.Root.get("/AcroForm")
+            if not isinstance(acroform, pikepdf.Dictionary):
+                logger.warning("No form fields found in %s", path.name)
+                return
+
+            # Collected by name first to resolve duplicate names as pypdf does
+            form_fields = dict(PDFAcroformExtractor._walk_pikepdf_fields(
+                acroform.get("/Fields", []),
+                parent_name=None,
+                seen=set()
+            ))
+
+            source_pdf = sys.intern(path.name)
+            for field_name, field_info in form_fields.items():
+                yield PDFAcroformExtractor._extract_field_info(
+                    field_name, field_info, source_pdf
+                )
+
+    @staticmethod
+    def _walk_pikepdf_fields(
+        nodes: Any,
+        parent_name: Optional[str],
+        seen: set
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (qualified name, field info) for each field in a pikepdf field tree."""
+        for node in nodes:
+            if not isinstance(node, pikepdf.Dictionary) or node.objgen in seen:
+                continue
+            if node.is_indirect:
+                seen.add(node.objgen)
+
+            if "/TM" in node:
+                name = str(node.TM)
+            elif parent_name is not None:
+                name = f"{parent_name}.{node.get('/T', '')}"
+            else:
+                name = str(node.get("/T", ""))
+
+            if "/T" in node or "/TM" in node:
+                yield name, PDFAcroformExtractor._pikepdf_field_info(node)
+
+            if "/Kids" in node:
+                yield from PDFAcroformExtractor._walk_pikepdf_fields(node.Kids, name, seen)
+
+    @staticmethod
+    def _pikepdf_field_info(node: Any) -> Dict[str, Any]:
+        """Convert a pikepdf field dictionary into the mapping _extract_field_info reads."""
+        field_info = {}
+        for key in ("/FT", "/Ff", "/V", "/Opt", "/MaxLen"):
+            if key in node:
+                field_info[key] = PDFAcroformExtractor._pikepdf_to_python(node[key])
+        return field_info
+
+    @staticmethod
+    def _pikepdf_to_python(obj: Any) -> object:
+        """Convert a pikepdf object to the equivalent plain Python value."""
+        if isinstance(obj, pikepdf.Array):
+            return [PDFAcroformExtractor._pikepdf_to_python(item) for item in obj]
+        if isinstance(obj, pikepdf.Stream):
+            return obj.read_bytes().decode("utf-8", errors="replace")
+        if isinstance(obj, (pikepdf.Name, pikepdf.String)):
+            return str(obj)
+        return obj
+
+    async def extract_from_multiple_files_async(
+        self,
+        pdf_paths: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract acroform fields from multiple PDF files without blocking the event loop.
+
+        Each file is read and parsed in a worker thread, so the calling event
+        loop stays responsive and can overlap extraction with other work.
+        Missing files are reported and skipped rather than aborting the batch.
+
+        Args:
+            pdf_paths: List of paths to PDF files
+
+        Returns:
+            Combined list of all fields from all PDFs, in input file order
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(None, self._extract_records_or_skip, pdf_path)
+            for pdf_path in pdf_paths
+        ))
+
+        all_fields: List[AcroField] = []
+        for pdf_path, fields in zip(pdf_paths, results):
+            logger.debug("Extracted %d fields from %s", len(fields), pdf_path)
             all_fields.extend(fields)
-            print(f"  Extracted {len(fields)} fields")
 
-        print(f"\nTotal fields extracted: {len(all_fields)}")
-        return all_fields
+        logger.info("Total fields extracted: %d", len(all_fields))
+        return _legacy_as_dicts(all_fields)
+
+    def _extract_records_or_skip(self, pdf_path: str) -> List[AcroField]:
+        """Extract records from one file of a batch, skipping it if it's missing."""
+        try:
+            return self.extract_records_from_file(pdf_path)
+        except FileNotFoundError:
+            logger.warning("PDF file not found, skipping: %s", pdf_path)
+            return []
 
+    def extract_to_arrow(self, pdf_paths: List[str]) -> "pyarrow.Table":
+        """
+        Extract acroform fields from multiple PDF files into a PyArrow table.
+
+        Field records are streamed into one column per attribute instead of
+        being collected in a list, so the result can be written
+        straight to Parquet or converted to a DataFrame. Requires pyarrow.
+
+        Args:
+            pdf_paths: List of paths to PDF files
+
+        Returns:
+            Table with one row per field, in input file order
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                "Arrow output requires pyarrow. Install it with: pip install pyarrow"
+            ) from e
+
+        schema = pyarrow.schema([
+            ("field_name", pyarrow.string()),
+            ("source_pdf", pyarrow.string()),
+            ("field_type", pyarrow.string()),
+            ("required", pyarrow.bool_()),
+            ("value", pyarrow.string()),
+            ("options", pyarrow.list_(pyarrow.string())),
+            ("max_length", pyarrow.int64()),
+            ("page", pyarrow.int64()),
+        ])
+        columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        appends = [(name, columns[name].append) for name in schema.names]
+
+        for field in self.iter_records_from_multiple_files(pdf_paths):
+            for name, append in appends:
+                append(getattr(field, name))
+
+        return pyarrow.table(columns, schema=schema)
+
+    def extract_to_dataframe(self, pdf_paths: List[str]) -> "pandas.DataFrame":
+        """
+        Extract acroform fields from multiple PDF files into a pandas DataFrame.
+
+        Built column-wise through extract_to_arrow, which avoids pandas
+        transposing a list of dictionaries. Requires pyarrow and pandas.
+
+        Args:
+            pdf_paths: List of paths to PDF files
+
+        Returns:
+            DataFrame with one row per field, in input file order
+        """
+        return self.extract_to_arrow(pdf_paths).to_pandas()
+
+    @staticmethod
     def _extract_field_info(
-        self,
         field_name: str,
-        field_info: Any,
+        field_info: object,
         source_pdf: str
-    ) -> Dict[str, Any]:
+    ) -> AcroField:
         """
         Extract detailed information about a form field.
 
+        Reads every attribute in a single pass over field_info.
+
         Args:
             field_name: Name of the field
             field_info: Field information from pypdf
             source_pdf: Name of the source PDF file
 
         Returns:
-            Dictionary with field information
-        """
-        field_data = {
-            "field_name": field_name,
-            "source_pdf": source_pdf,
-            "field_type": self._get_field_type(field_info),
-            "required": self._is_required(field_info),
-            "value": self._get_field_value(field_info),
-            "options": self._get_field_options(field_info),
-            "max_length": self._get_max_length(field_info),
-            "page": self._get_page_number(field_info),
-        }
-
-        return field_data
+            Record with field information
+        """
+        # pypdf returns names as TextStringObject; keep plain str so the
+        # names serialize (and hash) like any other string. Interned, since
+        # files filled from the same form repeat the same names.
+        field_name = sys.intern(str(field_name))
 
-    def _get_field_type(self, field_info: Any) -> str:
-        """Determine the type of form field."""
         if not isinstance(field_info, dict):
-            return "text"
+            return AcroField(
+                field_name=field_name,
+                source_pdf=source_pdf,
+                field_type="text",
+                required=False,
+                value=None,
+                options=None,
+                max_length=None,
+                page=None,
+            )
+
+        # /FT is a NameObject (pypdf) or str (pikepdf); NameObject subclasses
+        # str and hashes like it, so it keys into _FT_MAP without conversion
+        try:
+            field_type = _FT_MAP.get(field_info.get("/FT", ""), "text")
+        except TypeError:  # malformed, unhashable /FT (e.g. an array)
+            field_type = "text"
+        flags = field_info.get("/Ff", 0)
+        value = field_info.get("/V")
+
+        # /Opt only applies to choice fields and buttons (radio export values),
+        # /MaxLen only to text fields
+        options = None
+        max_length = None
+        if field_type == "choice" or field_type == "button":
+            opts = field_info.get("/Opt")
+            if opts and isinstance(opts, list):
+                options = tuple(str(opt) for opt in opts)
+        elif field_type == "text":
+            max_len = field_info.get("/MaxLen")
+            if max_len is None:
+                # pypdf's Field copies a fixed set of attributes that leaves
+                # out /MaxLen; read it from the field's own dictionary
+                ref = getattr(field_info, "indirect_reference", None)
+                if ref is not None:
+                    max_len = ref.get_object().get("/MaxLen")
+            if max_len:
+                max_length = int(max_len)
+
+        return AcroField(
+            field_name=field_name,
+            source_pdf=source_pdf,
+            field_type=field_type,
+            # Bit 2 of the field flags marks a required field
+            required=bool(flags & 2) if isinstance(flags, int) else False,
+            value=str(value) if value else None,
+            options=options,
+            max_length=max_length,
+            # pypdf doesn't provide easy access to the page a field appears on
+            page=None,
+        )
+
+
+# How much of the end of a file to prefault: pypdf starts at the trailer
+_TAIL_SIZE = 4096
+
+
+@contextmanager
+def _map_file(file: BinaryIO) -> Iterator[Union[mmap.mmap, BinaryIO]]:
+    """
+    Map an open PDF into memory for pypdf to read from.
 
-        field_type = field_info.get("/FT", "")
+    pypdf seeks around the xref table and reads objects in small pieces;
+    reading from a mapping avoids a read() syscall for each of them. Falls
+    back to the file itself when it can't be mapped (e.g. an empty file).
+    """
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        yield file
+        return
 
-        type_mapping = {
-            "/Tx": "text",
-            "/Btn": "button",
-            "/Ch": "choice",
-            "/Sig": "signature"
-        }
+    with mapped:
+        yield mapped
 
-        return type_mapping.get(str(field_type), "text")
 
-    def _is_required(self, field_info: Any) -> bool:
-        """Check if field is required."""
-        if not isinstance(field_info, dict):
-            return False
+def _advise_random_access(mapped: mmap.mmap) -> None:
+    """Tell the kernel a mapped PDF is about to be read the way pypdf reads it."""
+    if not hasattr(mapped, "madvise"):
+        return
 
-        flags = field_info.get("/Ff", 0)
-        # Bit 2 indicates required field
-        return bool(flags & 2) if isinstance(flags, int) else False
+    # Objects are reached through the xref table, not read in order
+    mapped.madvise(mmap.MADV_RANDOM)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        size = len(mapped)
+        start = max(size - _TAIL_SIZE, 0) // mmap.PAGESIZE * mmap.PAGESIZE
+        mapped.madvise(mmap.MADV_WILLNEED, start, size - start)
 
-    def _get_field_value(self, field_info: Any) -> Optional[str]:
-        """Get the current value of the field."""
-        if not isinstance(field_info, dict):
-            return None
 
-        value = field_info.get("/V")
-        if value:
-            return str(value)
-        return None
+# How much of the end of a file _prefetch reads ahead: the xref table,
+# trailer and (in updated files) the latest catalog and field objects
+_PREFETCH_TAIL_SIZE = 1 << 20
+
+# Files per worker that pool extraction keeps read ahead
+_PREFETCH_FILES_PER_WORKER = 2
 
-    def _get_field_options(self, field_info: Any) -> Optional[List[str]]:
-        """Get options for choice fields (dropdowns, radio buttons)."""
-        if not isinstance(field_info, dict):
-            return None
 
-        # Check for /Opt (options array)
-        opts = field_info.get("/Opt")
-        if opts:
-            if isinstance(opts, list):
-                return [str(opt) for opt in opts]
+def _prefetch(pdf_paths: List[str]) -> None:
+    """
+    Ask the kernel to start reading the end of each PDF into the page cache.
+
+    posix_fadvise(WILLNEED) only queues readahead and returns immediately,
+    so the reads for all files are in flight together instead of each file
+    blocking on its own cache misses when it is parsed. Only the last
+    _PREFETCH_TAIL_SIZE bytes are requested, where parsing starts; the
+    parsers read little of the rest. Callers pass a window of upcoming
+    files rather than a whole batch, which could evict early files before
+    they are parsed. A no-op where posix_fadvise is unavailable (e.g.
+    Windows, macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
 
-        return None
+    for pdf_path in pdf_paths:
+        try:
+            fd = os.open(pdf_path, os.O_RDONLY)
+        except OSError:
+            continue  # reported when the file is extracted
+        try:
+            start = max(os.fstat(fd).st_size - _PREFETCH_TAIL_SIZE, 0)
+            os.posix_fadvise(fd, start, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
-    def _get_max_length(self, field_info: Any) -> Optional[int]:
-        """Get maximum length for text fields."""
-        if not isinstance(field_info, dict):
-            return None
 
-        max_len = field_info.get("/MaxLen")
-        if max_len:
-            return int(max_len)
-        return None
+# A plain Python class even under mypyc: logging keeps weak references to
+# its handlers, which native classes don't support safely
+@mypyc_attr(native_class=False)
+class _ForwardHandler(logging.Handler):
+    """Pass a record received from a worker process to the logger it was logged on."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker_logging(
+    log_queue: "multiprocessing.Queue[logging.LogRecord]",
+    level: int
+) -> None:
+    """Send this module's log records from a worker process to the parent."""
+    # Drop handlers inherited from the parent (fork), which would write to
+    # the shared stdout/stderr directly
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.propagate = False
+    logger.setLevel(level)
+
 
-    def _get_page_number(self, field_info: Any) -> Optional[int]:
-        """Get the page number where the field appears."""
-        # This is more complex and may not always be available
-        # pypdf doesn't always provide easy access to page numbers
-        # We'll return None for now, but this could be enhanced
-        return None
+def _extract_one(pdf_path: str, backend: Optional[str] = None) -> List[AcroField]:
+    """Extract fields from one PDF. Module-level so worker processes can run it."""
+    return PDFAcroformExtractor(backend).extract_records_from_file(pdf_path)
 
 
-def extract_acroforms(pdf_paths: List[str]) -> List[Dict[str, Any]]:
+def extract_acroforms(
+    pdf_paths: List[str],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Convenience function to extract acroforms from multiple PDFs.
 
     Args:
         pdf_paths: List of paths to PDF files
+        max_workers: Maximum number of workers (default: CPU count, or one
+            per file for small batches)
 
     Returns:
         List of all extracted fields
     """
     extractor = PDFAcroformExtractor()
-    return extractor.extract_from_multiple_files(pdf_paths)
+    return extractor.extract_from_multiple_files(pdf_paths, max_workers=max_workers)